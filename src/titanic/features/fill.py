@@ -1,51 +1,266 @@
+import functools
+import numbers
+from typing import TYPE_CHECKING, Optional
+
 import pandas
 import numpy as np
-from sklearn.impute import SimpleImputer
 from sklearn.base import BaseEstimator, TransformerMixin
 
+if TYPE_CHECKING:
+    from sklearn.impute import SimpleImputer
+
 
 __all__ = ["embarked_imputer", "fill_embarked", "age_imputer", "fill_age"]
 
+# Rows per independently seeded chunk in the parallel numba kernel. The
+# chunking depends only on the column length, not the thread count, so the
+# kernel's results are reproducible across machines. They do not match the
+# NumPy path, which draws from a different generator.
+_NUMBA_CHUNK_SIZE = 1 << 18
+
+# Above this share of missing values a masked write beats an index scatter.
+_DENSE_MISSING_RATIO = 0.3
+
+# The NaN mask is built this many rows at a time so it stays cache-resident.
+_MASK_BLOCK_SIZE = 1 << 18
+
+
+@functools.lru_cache(maxsize=None)
+def _numba_fill_age_kernel():
+    """Import numba and build the fill kernel on first use; None without numba."""
+    try:
+        import numba
+    except ImportError:  # numba is an optional speedup
+        return None
+
+    @numba.njit(parallel=True, nogil=True, cache=True)
+    def _fill_age_kernel(arr, min_age, max_age, seeds):
+        """Replace NaNs in ``arr`` in place with random ints in [min_age, max_age].
+
+        The array is split into ``len(seeds)`` chunks filled in parallel, each
+        from its own seed. Returns the number of values filled.
+        """
+        n = arr.shape[0]
+        n_chunks = seeds.shape[0]
+        n_missing = 0
+        for t in numba.prange(n_chunks):
+            lo = t * n // n_chunks
+            hi = (t + 1) * n // n_chunks
+            np.random.seed(seeds[t])
+            for i in range(lo, hi):
+                if np.isnan(arr[i]):
+                    arr[i] = np.random.randint(min_age, max_age + 1)
+                    n_missing += 1
+        return n_missing
+
+    return _fill_age_kernel
+
+
+def embarked_imputer() -> "SimpleImputer":
+    # Imported here so callers that only fill Age don't pay for sklearn.impute.
+    from sklearn.impute import SimpleImputer
 
-def embarked_imputer() -> SimpleImputer:
     return SimpleImputer(strategy="most_frequent")
 
 
-def fill_embarked(df: pandas.DataFrame) -> pandas.Series:
-    return embarked_imputer().fit_transform(df[["Embarked"]])
+def fill_embarked(df: pandas.DataFrame) -> np.ndarray:
+    """Fill missing Embarked values with the most frequent port.
+
+    Same result as ``embarked_imputer().fit_transform(df[["Embarked"]])``
+    (ties resolved to the smallest value, 2-D output) without going through
+    sklearn's validation on every call. An all-missing column has no mode
+    and is returned unfilled.
+    """
+    col = df["Embarked"]
+    mode = col.mode(dropna=True)
+    if mode.empty:
+        return col.to_numpy().reshape(-1, 1)
+    return col.fillna(mode.iloc[0]).to_numpy().reshape(-1, 1)
+
+
+def _draw_ages(
+    rng: np.random.Generator, min_age: int, max_age: int, size: int
+) -> np.ndarray:
+    """Draw ``size`` random ints in [min_age, max_age], at least 16 bits wide."""
+    # 8-bit draws measure ~3x slower than int16 in Generator.integers, so
+    # int16 is the narrowest dtype used. A hand-rolled rng.bytes rejection
+    # sampler for the default 1..80 range is also 2.5-3.7x slower than these
+    # int16 draws, so there is no special case for it.
+    dtype = np.promote_types(
+        np.int16,
+        np.promote_types(np.min_scalar_type(min_age), np.min_scalar_type(max_age)),
+    )
+    if not np.issubdtype(dtype, np.integer):
+        # Float bounds such as 1.0 are accepted by integers, not as a dtype.
+        dtype = np.dtype(np.int64)
+    return rng.integers(min_age, max_age, size=size, dtype=dtype, endpoint=True)
+
+
+def _fill_age_inplace(
+    arr: np.ndarray,
+    min_age: int,
+    max_age: int,
+    seed: Optional[int] = None,
+    use_numba: bool = False,
+) -> int:
+    """Fill NaNs in the 1-D float64 ``arr`` in place; return how many were filled.
+
+    ``use_numba`` selects the parallel numba kernel explicitly, so the draws
+    for a given ``seed`` never depend on what happens to be installed.
+    """
+    # Validate before choosing a path so every column size fails the same way.
+    if min_age > max_age:
+        raise ValueError(f"min_age must not exceed max_age, got {min_age} > {max_age}")
+    if seed is not None and not isinstance(seed, numbers.Integral):
+        raise ValueError(f"random_state must be None or an int, got {seed!r}")
+
+    if min_age == max_age:
+        # Degenerate range: a constant fill needs no random draws.
+        mask = np.isnan(arr)
+        n_missing = int(np.count_nonzero(mask))
+        np.putmask(arr, mask, min_age)
+    elif use_numba:
+        kernel = _numba_fill_age_kernel()
+        if kernel is None:
+            raise ImportError("use_numba=True requires numba to be installed")
+        # The kernel finds, counts and fills the NaNs in a single pass.
+        n_chunks = -(-arr.shape[0] // _NUMBA_CHUNK_SIZE)
+        seeds = np.random.SeedSequence(seed).generate_state(n_chunks)
+        n_missing = kernel(arr, int(min_age), int(max_age), seeds)
+    else:
+        rng = np.random.default_rng(seed)
+        # Reuse one block-sized mask buffer instead of allocating a bool
+        # array as long as the column.
+        mask_buf = np.empty(min(arr.size, _MASK_BLOCK_SIZE), dtype=bool)
+        n_missing = 0
+        for start in range(0, arr.size, _MASK_BLOCK_SIZE):
+            block = arr[start : start + _MASK_BLOCK_SIZE]
+            mask = mask_buf[: block.size]
+            np.isnan(block, out=mask)
+            n_block = int(np.count_nonzero(mask))
+            if not n_block:
+                continue
+            random_ages = _draw_ages(rng, min_age, max_age, n_block)
+            if n_block > _DENSE_MISSING_RATIO * block.size:
+                # np.place consumes the values in mask order, unlike
+                # np.putmask which would cycle them by flat position.
+                np.place(block, mask, random_ages)
+            else:
+                # Few NaNs: write only the missing slots by index.
+                block[np.flatnonzero(mask)] = random_ages
+            n_missing += n_block
+
+    return n_missing
+
+
+def _fill_age_fast(
+    s: pandas.Series,
+    min_age: int,
+    max_age: int,
+    seed: Optional[int] = None,
+    copy: bool = True,
+    use_numba: bool = False,
+) -> pandas.Series:
+    """Fill NaNs in ``s`` with random ints in [min_age, max_age], skipping sklearn.
+
+    With ``copy=False`` a writeable float64 buffer behind ``s`` is filled in
+    place; read-only views (pandas copy-on-write) are still copied.
+    """
+    values = s.to_numpy(dtype=np.float64, copy=False)
+    if copy or not values.flags.writeable:
+        # Allocate the output buffer once; the fill writes into it in place.
+        arr = np.empty_like(values)
+        np.copyto(arr, values)
+    else:
+        arr = values
+    n_missing = _fill_age_inplace(arr, min_age, max_age, seed, use_numba)
+
+    if n_missing == 0:
+        return s.copy() if copy else s
+
+    # The filled values are whole numbers, so the column is integral
+    # exactly when the observed ages were; fractional ages stay float.
+    # Comparing against the cast reuses the int64 array we return anyway.
+    with np.errstate(invalid="ignore"):
+        ints = arr.astype(np.int64)
+    if np.array_equal(arr, ints):
+        arr = ints
+    return pandas.Series(arr, index=s.index, name=s.name, copy=False)
 
 
 class RandomAgeImputer(BaseEstimator, TransformerMixin):
-    """Custom imputer that fills missing Age values with random integers between min_age and max_age."""
+    """Custom imputer that fills missing Age values with random integers between min_age and max_age.
+
+    With ``copy=False`` the input's float64 buffer is filled in place where
+    it is writeable, so the caller's data is modified.
+
+    ``use_numba=True`` fills with a parallel numba kernel instead of NumPy
+    (numba must be installed). A fixed ``random_state`` reproduces the same
+    ages on any machine for either setting, but the two settings draw
+    different ages from the same ``random_state``.
+    """
     
-    def __init__(self, min_age: int = 1, max_age: int = 80, random_state: int = None):
+    def __init__(
+        self,
+        min_age: int = 1,
+        max_age: int = 80,
+        random_state: int = None,
+        copy: bool = True,
+        use_numba: bool = False,
+    ):
         self.min_age = min_age
         self.max_age = max_age
         self.random_state = random_state
+        self.copy = copy
+        self.use_numba = use_numba
     
     def fit(self, X, y=None):
         """Fit method - no fitting required for random imputation."""
         return self
     
+    def fit_transform(self, X, y=None, **fit_params):
+        """Fit-transform method - fit is a no-op, so this is just transform."""
+        return self.transform(X)
+
     def transform(self, X):
         """Transform method - fill missing values with random ages."""
-        X_copy = X.copy()
-        if self.random_state is not None:
-            np.random.seed(self.random_state)
-        
-        # Find missing values
-        missing_mask = X_copy.isna()
-        n_missing = missing_mask.sum()
-        
-        if n_missing > 0:
-            # Generate random ages for missing values
-            random_ages = np.random.randint(self.min_age, self.max_age + 1, size=n_missing)
-            X_copy[missing_mask] = random_ages
-            # Convert to integer type if all values are filled
-            if not X_copy.isna().any():
-                X_copy = X_copy.astype(int)
-        
-        return X_copy
+        return _fill_age_fast(
+            X,
+            self.min_age,
+            self.max_age,
+            self.random_state,
+            copy=self.copy,
+            use_numba=self.use_numba,
+        )
+
+    def transform_array(
+        self, arr: np.ndarray, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Fill missing values in a 1-D array, writing into ``out`` if given.
+
+        ``out`` must be a float64 array of the same shape; passing ``arr``
+        itself fills it in place, as does ``copy=False`` on a float64 ``arr``.
+        The result is always float64.
+        """
+        values = np.asarray(arr, dtype=np.float64)
+        if values.ndim != 1:
+            raise ValueError(f"arr must be 1-D, got shape {values.shape}")
+        if out is None:
+            if self.copy or not values.flags.writeable:
+                out = np.empty_like(values)
+            else:
+                out = values
+        elif out.shape != values.shape or out.dtype != np.float64:
+            raise ValueError(
+                f"out must be a float64 array of shape {values.shape}, "
+                f"got {out.dtype} array of shape {out.shape}"
+            )
+        if out is not values:
+            np.copyto(out, values)
+        _fill_age_inplace(
+            out, self.min_age, self.max_age, self.random_state, self.use_numba
+        )
+        return out
 
 
 def age_imputer(min_age: int = 1, max_age: int = 80, random_state: int = None) -> RandomAgeImputer:
@@ -74,5 +289,4 @@ def fill_age(df: pandas.DataFrame, min_age: int = 1, max_age: int = 80, random_s
     Returns:
         Series with filled Age values
     """
-    imputer = age_imputer(min_age=min_age, max_age=max_age, random_state=random_state)
-    return imputer.fit_transform(df["Age"])
+    return _fill_age_fast(df["Age"], min_age, max_age, random_state)
@@ -14,6 +14,8 @@ class TestRandomAgeImputer:
         assert imputer.min_age == 1
         assert imputer.max_age == 80
         assert imputer.random_state is None
+        assert imputer.copy is True
+        assert imputer.use_numba is False
     
     def test_init_custom_params(self):
         """Test initialization with custom parameters."""
@@ -28,6 +30,13 @@ class TestRandomAgeImputer:
         result = imputer.fit(pd.Series([1, 2, np.nan]))
         assert result is imputer
     
+    def test_fit_transform_matches_transform(self):
+        """Test that fit_transform returns the same result as transform."""
+        ages = pd.Series([25, np.nan, 45, np.nan])
+        imputer = RandomAgeImputer(random_state=42)
+        
+        pd.testing.assert_series_equal(imputer.fit_transform(ages), imputer.transform(ages))
+    
     def test_transform_no_missing_values(self):
         """Test transform when there are no missing values."""
         imputer = RandomAgeImputer(random_state=42)
@@ -71,6 +80,26 @@ class TestRandomAgeImputer:
         assert 1 <= result.iloc[1] <= 80
         assert 1 <= result.iloc[3] <= 80
     
+    def test_transform_keeps_fractional_ages(self):
+        """Test that non-integer observed ages are not truncated."""
+        imputer = RandomAgeImputer(min_age=1, max_age=80, random_state=42)
+        ages = pd.Series([0.42, np.nan, 14.5, 30.0])
+        result = imputer.transform(ages)
+        
+        assert result.dtype == np.float64
+        assert result.iloc[0] == 0.42
+        assert result.iloc[2] == 14.5
+        assert float(result.iloc[1]).is_integer()
+    
+    def test_transform_constant_range(self):
+        """Test that min_age == max_age fills every missing value with that age."""
+        imputer = RandomAgeImputer(min_age=30, max_age=30)
+        ages = pd.Series([25, np.nan, 45, np.nan])
+        result = imputer.transform(ages)
+        
+        assert list(result) == [25, 30, 45, 30]
+        assert result.dtype == np.int64
+    
     def test_transform_reproducibility(self):
         """Test that transform produces reproducible results with same random_state."""
         ages = pd.Series([np.nan, np.nan, 25, np.nan])
@@ -82,6 +111,174 @@ class TestRandomAgeImputer:
         result2 = imputer2.transform(ages)
         
         pd.testing.assert_series_equal(result1, result2)
+    
+    def test_transform_keeps_global_random_state(self):
+        """Test that transform does not reseed the global NumPy RNG."""
+        ages = pd.Series([np.nan, 25, np.nan])
+        state = np.random.get_state()
+        
+        RandomAgeImputer(random_state=42).transform(ages)
+        
+        after = np.random.get_state()
+        assert state[0] == after[0]
+        np.testing.assert_array_equal(state[1], after[1])
+        assert state[2:] == after[2:]
+    
+    def test_transform_float_bounds(self):
+        """Test that whole-number float bounds are accepted like ints."""
+        imputer = RandomAgeImputer(min_age=1.0, max_age=80.0, random_state=0)
+        result = imputer.transform(pd.Series([np.nan, 25, np.nan]))
+        
+        assert result.dtype == np.int64
+        assert result.between(1, 80).all()
+    
+    def test_transform_sparse_and_dense_paths_agree(self, monkeypatch):
+        """Test that the scatter and masked-write paths fill the same values."""
+        from titanic.features import fill
+        
+        ages = pd.Series([25, np.nan, 45, 50, 60, 33, np.nan, 70, 18, 40])
+        imputer = RandomAgeImputer(random_state=42)
+        
+        monkeypatch.setattr(fill, "_DENSE_MISSING_RATIO", 1.0)
+        sparse = imputer.transform(ages)
+        monkeypatch.setattr(fill, "_DENSE_MISSING_RATIO", 0.0)
+        dense = imputer.transform(ages)
+        
+        pd.testing.assert_series_equal(sparse, dense)
+        assert not sparse.isna().any()
+        assert sparse.iloc[0] == 25
+        assert sparse.iloc[9] == 40
+    
+    def test_transform_blockwise_mask(self, monkeypatch):
+        """Test filling a column that spans several mask blocks."""
+        from titanic.features import fill
+        
+        monkeypatch.setattr(fill, "_MASK_BLOCK_SIZE", 3)
+        ages = pd.Series([25, np.nan, 45, np.nan, np.nan, np.nan, 50, 60])
+        result = RandomAgeImputer(min_age=1, max_age=10, random_state=42).transform(ages)
+        
+        assert not result.isna().any()
+        assert list(result.iloc[[0, 2, 6, 7]]) == [25, 45, 50, 60]
+        assert result.iloc[[1, 3, 4, 5]].between(1, 10).all()
+    
+    @pytest.mark.parametrize("use_numba", [False, True])
+    def test_transform_rejects_bad_params(self, use_numba):
+        """Test that invalid parameters raise ValueError on every fill path."""
+        ages = pd.Series([np.nan, 25, np.nan])
+        with pytest.raises(ValueError, match="min_age"):
+            RandomAgeImputer(min_age=50, max_age=10, use_numba=use_numba).transform(ages)
+        with pytest.raises(ValueError, match="random_state"):
+            RandomAgeImputer(
+                random_state=np.random.default_rng(0), use_numba=use_numba
+            ).transform(ages)
+    
+    def test_transform_numba_kernel(self, monkeypatch):
+        """Test the opt-in numba fill path over several seeded chunks."""
+        pytest.importorskip("numba")
+        from titanic.features import fill
+        
+        monkeypatch.setattr(fill, "_NUMBA_CHUNK_SIZE", 16)
+        ages = pd.Series([np.nan, 25, np.nan, 50] * 25)
+        imputer = RandomAgeImputer(min_age=10, max_age=20, random_state=42, use_numba=True)
+        
+        result1 = imputer.transform(ages)
+        result2 = imputer.transform(ages)
+        
+        pd.testing.assert_series_equal(result1, result2)
+        assert (result1.iloc[1::4] == 25).all()
+        assert (result1.iloc[3::4] == 50).all()
+        filled = pd.concat([result1.iloc[0::4], result1.iloc[2::4]])
+        assert filled.between(10, 20).all()
+        assert filled.nunique() > 1
+    
+    @pytest.mark.parametrize("min_age,max_age", [(1, 80), (0, 300), (-5, 5), (1, 70000)])
+    def test_transform_draw_dtype_range(self, min_age, max_age):
+        """Test that narrow-dtype draws still cover the requested range."""
+        imputer = RandomAgeImputer(min_age=min_age, max_age=max_age, random_state=0)
+        result = imputer.transform(pd.Series([np.nan] * 500))
+        
+        assert result.dtype == np.int64
+        assert (result >= min_age).all()
+        assert (result <= max_age).all()
+        assert result.nunique() > 1
+    
+    def test_transform_array_matches_transform(self):
+        """Test that transform_array fills the same values as transform."""
+        ages = np.array([25.0, np.nan, 45.0, np.nan, 50.0])
+        imputer = RandomAgeImputer(random_state=42)
+        
+        result = imputer.transform_array(ages)
+        
+        assert result.dtype == np.float64
+        np.testing.assert_array_equal(result, imputer.transform(pd.Series(ages)))
+        assert np.isnan(ages).sum() == 2
+    
+    def test_transform_array_out(self):
+        """Test that transform_array writes into a provided buffer."""
+        ages = np.array([np.nan, 30.0, np.nan])
+        out = np.empty(3)
+        imputer = RandomAgeImputer(min_age=5, max_age=9, random_state=0)
+        
+        result = imputer.transform_array(ages, out=out)
+        
+        assert result is out
+        assert out[1] == 30.0
+        assert ((out[[0, 2]] >= 5) & (out[[0, 2]] <= 9)).all()
+    
+    def test_transform_array_in_place(self):
+        """Test that passing the input as out fills it in place."""
+        ages = np.array([np.nan, 30.0, np.nan])
+        result = RandomAgeImputer(random_state=0).transform_array(ages, out=ages)
+        
+        assert result is ages
+        assert not np.isnan(ages).any()
+    
+    def test_transform_array_no_copy(self):
+        """Test that copy=False fills a float64 input array in place."""
+        ages = np.array([np.nan, 30.0, np.nan])
+        result = RandomAgeImputer(random_state=0, copy=False).transform_array(ages)
+        
+        assert result is ages
+        assert not np.isnan(ages).any()
+    
+    def test_transform_no_copy(self):
+        """Test that copy=False gives the same values as the default."""
+        ages = pd.Series([25, np.nan, 45, np.nan])
+        expected = RandomAgeImputer(random_state=42).transform(ages)
+        result = RandomAgeImputer(random_state=42, copy=False).transform(ages.copy())
+        
+        pd.testing.assert_series_equal(result, expected)
+    
+    def test_transform_array_rejects_bad_out(self):
+        """Test that a mismatched out buffer is rejected."""
+        imputer = RandomAgeImputer()
+        with pytest.raises(ValueError):
+            imputer.transform_array(np.array([np.nan, 1.0]), out=np.empty(3))
+        with pytest.raises(ValueError):
+            imputer.transform_array(np.array([np.nan, 1.0]), out=np.empty(2, dtype=np.int64))
+    
+    def test_transform_default_never_uses_numba(self, monkeypatch):
+        """Test that the default path fills the same whether or not numba exists."""
+        from titanic.features import fill
+        
+        ages = pd.Series([25, np.nan, 45, np.nan, np.nan])
+        expected = RandomAgeImputer(random_state=42).transform(ages)
+        
+        def no_numba():
+            raise AssertionError("numba kernel requested without use_numba")
+        
+        monkeypatch.setattr(fill, "_numba_fill_age_kernel", no_numba)
+        result = RandomAgeImputer(random_state=42).transform(ages)
+        
+        pd.testing.assert_series_equal(result, expected)
+    
+    def test_transform_use_numba_requires_numba(self, monkeypatch):
+        """Test that opting into numba without it installed raises ImportError."""
+        from titanic.features import fill
+        
+        monkeypatch.setattr(fill, "_numba_fill_age_kernel", lambda: None)
+        with pytest.raises(ImportError, match="numba"):
+            RandomAgeImputer(use_numba=True).transform(pd.Series([np.nan, 25]))
 
 
 class TestAgeImputer:
@@ -188,4 +385,20 @@ class TestFillAge:
         # Check that we actually get some variety in the generated ages
         # (with 100 samples, we should get multiple different values)
         unique_values = result.nunique()
-        assert unique_values > 1  # Should have more than 1 unique value
\ No newline at end of file
+        assert unique_values > 1  # Should have more than 1 unique value
+    
+    def test_fill_age_matches_imputer(self):
+        """Test that fill_age gives the same result as the sklearn imputer."""
+        df = pd.DataFrame({'Age': [25, np.nan, 45, np.nan, np.nan, 50]})
+        
+        expected = age_imputer(min_age=5, max_age=60, random_state=7).fit_transform(df['Age'])
+        result = fill_age(df, min_age=5, max_age=60, random_state=7)
+        
+        pd.testing.assert_series_equal(result, expected)
+    
+    def test_fill_age_constant_range(self):
+        """Test fill_age with a degenerate age range."""
+        df = pd.DataFrame({'Age': [np.nan, 12.5, np.nan]})
+        result = fill_age(df, min_age=1, max_age=1)
+        
+        assert list(result) == [1.0, 12.5, 1.0]
@@ -0,0 +1,34 @@
+import pandas as pd
+import numpy as np
+
+from titanic.features.fill import embarked_imputer, fill_embarked
+
+
+def test_fill_embarked_most_frequent():
+    df = pd.DataFrame({"Embarked": ["S", None, "C", "S", np.nan]})
+    result = fill_embarked(df)
+
+    assert result.shape == (5, 1)
+    assert list(result[:, 0]) == ["S", "S", "C", "S", "S"]
+
+
+def test_fill_embarked_matches_simple_imputer():
+    df = pd.DataFrame({"Embarked": ["Q", "C", None, "C", "Q", np.nan, "S"]})
+    expected = embarked_imputer().fit_transform(df[["Embarked"]])
+
+    np.testing.assert_array_equal(fill_embarked(df), expected)
+
+
+def test_fill_embarked_does_not_modify_input():
+    df = pd.DataFrame({"Embarked": ["S", None, "C"]})
+    fill_embarked(df)
+
+    assert df["Embarked"].isna().sum() == 1
+
+
+def test_fill_embarked_all_missing():
+    df = pd.DataFrame({"Embarked": [None]})
+    result = fill_embarked(df)
+
+    assert result.shape == (1, 1)
+    assert pd.isna(result[0, 0])